@@ -1,15 +1,257 @@
 from cycler import cycler, Cycler
-from typing import List
-from functools import reduce
-from multipledispatch import dispatch
-import matplotlib.pyplot as plt
-import matplotlib.axes as mplAx
-import matplotlib.figure as mplFig
+from typing import List, TYPE_CHECKING
+from functools import lru_cache
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib.style as mplStyle
 import matplotlib as mpl
 import pandas as pd
+import numpy as np
+import contextlib
 import pathlib
+import os
+import stat
+import mmap
 import parse
 import json
+import warnings
+
+from ._readcache import cachedRead
+
+#Only needed for the annotations. Importing the axes module loads most of matplotlib which is left to the first plot
+if TYPE_CHECKING:
+    import matplotlib.axes as mplAx
+
+#Marks an argument which was not passed at all (as opposed to passed as None)
+_MISSING = object()
+
+def _pyplot():
+    """Returns matplotlib.pyplot, importing it on first use. Importing pyplot sets up a backend which is wasted time when the data is only being read"""
+    import matplotlib.pyplot as plt
+    return plt
+
+#The file name standards used by SpectExp.nameParse. Compiled once since compiling is most of the cost of parsing
+_NAME_PARSERS = [parse.compile(standard) for standard in [
+    "{Type}_{Sample}_{Hour}-{Minute}-{Second}-{Msec}.{file_type}",
+    "{Type}_{Sample}_{Background}_{Hour}-{Minute}-{Second}-{Msec}.{file_type}",
+    "{Type}_{Sample}_{Background}_{Type2}_{Number}.{file_type}",
+    "{Type}_{Sample}_{Type2}_{Number}.{file_type}"
+]]
+
+@lru_cache(maxsize = 1)
+def _availableStyles() -> frozenset:
+    """Returns the set of available matplotlib style sheets. Cached so that validating a style list is a set lookup. Style sheets added after the first call are not seen"""
+    return frozenset(mplStyle.available)
+
+@lru_cache(maxsize = None)
+def _resolvedStyle(style_sheet: tuple) -> dict:
+    """Returns the combined rcParams of a tuple of available style sheets. Later sheets override earlier ones just like matplotlib.pyplot.style.use"""
+    resolved = {}
+    for style in style_sheet:
+        resolved.update(mplStyle.library[style])
+    return resolved
+
+def _firstFailing(items, check) -> int:
+    """Returns the index of the first item which fails the check, or None if every item passes. Checks a whole list in one pass and still gives the offending index for error messages"""
+    return next((index for index, item in enumerate(items) if not check(item)), None)
+
+def _envFlag(name: str) -> bool:
+    """Checks if an environment variable switch is on. Only 1, true, yes and on (in any case) turn it on so that values like 0 or false leave it off"""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def _readSpectFile(source: pathlib.Path, delim: str, begin_line: str, convert_items: tuple, col_names: tuple):
+    """
+    Reads a spectral data file into its header lines and a dataframe. See SpectExp.readFile for the reading arguments. The conversion dictionary and column names come as tuples so the call can be cached with cachedRead
+    """
+    convert_dict = dict(convert_items) if isinstance(convert_items, tuple) else convert_items
+    col_names = None if col_names is None else list(col_names)
+
+    meta_list = []
+    skip_rows = 0
+    encoding = None
+
+    if begin_line is not None:
+        #Searching the mapped file for the marker avoids walking the header line by line
+        marker = begin_line.rstrip("\r\n").encode()
+
+        with open(source, "rb") as active_file, mmap.mmap(active_file.fileno(), 0, access = mmap.ACCESS_READ) as active_map:
+            offset = -1
+
+            #Only a whole line equal to the marker counts. Mentions of it inside other header lines are skipped
+            while True:
+                offset = active_map.find(marker, offset + 1)
+                if offset == -1:
+                    raise ValueError("The beginning line was not found in {}".format(source))
+                if offset != 0 and active_map[offset - 1:offset] != b"\n":
+                    continue
+
+                #The data starts on the line following the marker
+                line_end = offset + len(marker)
+                data_start = active_map.find(b"\n", line_end) + 1
+                if data_start == 0:
+                    data_start = len(active_map)
+
+                #Only a carriage return may follow the marker on its line
+                if active_map[line_end:data_start].rstrip(b"\r\n") == b"":
+                    break
+
+            #The header is split as bytes, which like the pandas tokenizer only breaks lines on \n and \r. Splitting the decoded text would also break on form feeds and other unicode line breaks and skip data rows
+            header_lines = active_map[:data_start].splitlines(keepends = True)
+            skip_rows = len(header_lines)
+
+            #Undecodable bytes are replaced since the header is only informative
+            meta_list = [line.decode("utf-8", errors = "replace") for line in header_lines]
+
+        #pandas still decodes the skipped header lines. Latin-1 accepts any byte and leaves the plain ascii numbers untouched
+        encoding = "latin-1"
+
+    #Opt in multithreaded reading for large files. Falls back to pandas when pyarrow is not installed
+    if _envFlag("SPECT_FAST_IO"):
+        pandas_read = _readArrowCsv(str(source), delim, skip_rows, col_names, convert_dict)
+        if pandas_read is not None:
+            return tuple(meta_list), pandas_read
+
+    #Every header line (marker included) is skipped so pandas can open and parse the file in one pass
+    pandas_read = pd.read_csv(source, sep = delim, names = col_names, dtype = convert_dict, skiprows = skip_rows, encoding = encoding,
+                              engine = "c", memory_map = True, low_memory = False)
+
+    return tuple(meta_list), pandas_read
+
+def _sortedPositions(sortedValues: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    """Returns the position of each grid value in the strictly increasing sortedValues, or -1 if it is not there. Both arrays are walked in order so no hash table is built"""
+    #An experiment without rows has none of the grid values
+    if len(sortedValues) == 0:
+        return np.full(len(grid), -1, dtype = np.intp)
+
+    positions = np.searchsorted(sortedValues, grid)
+
+    #Grid values past the end are pointed at the last value so the comparison below rejects them
+    np.minimum(positions, len(sortedValues) - 1, out = positions)
+    positions[sortedValues[positions] != grid] = -1
+    return positions
+
+def _fillComposed(buffer: np.ndarray, measureList: list, alignment: list):
+    """
+    Fills each column of the composed buffer with the measurements of one experiment. The alignment gives per experiment the row of each buffer row in its measurements (-1 if it was not measured), or None if the experiment is already on the grid. Works on plain arrays only so all of the work is done inside numpy
+    """
+    for column, (measures, positions) in enumerate(zip(measureList, alignment)):
+        target = buffer[:, column]
+
+        if positions is None:
+            target[:] = measures
+            continue
+
+        #take can not gather from an experiment without rows. None of its grid rows were measured
+        if len(measures) == 0:
+            target[:] = np.nan
+            continue
+
+        #Gathered straight into the buffer. The -1 rows are clipped onto a real row and then overwritten with nan. take needs matching types, which only costs a copy for integer measurements
+        np.take(measures.astype(buffer.dtype, copy = False), positions, out = target, mode = "clip")
+        target[positions < 0] = np.nan
+
+def _readArrowCsv(source: str, delim: str, skip_rows: int, col_names: list, convert_dict: dict) -> pd.DataFrame:
+    """Reads the csv like part of a spectral data file with the multithreaded pyarrow reader. Returns None if pyarrow is not installed"""
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    table = pacsv.read_csv(source, read_options = pacsv.ReadOptions(skip_rows = skip_rows, column_names = col_names),
+                           parse_options = pacsv.ParseOptions(delimiter = delim))
+    pandas_read = table.to_pandas()
+
+    #Like pandas the conversion keys which are not columns are ignored and a single type converts every column
+    if isinstance(convert_dict, dict):
+        pandas_read = pandas_read.astype({key: value for key, value in convert_dict.items() if key in pandas_read.columns})
+    elif convert_dict is not None:
+        pandas_read = pandas_read.astype(convert_dict)
+
+    return pandas_read
+
+#The stat results of the experiments being built by _buildExps, keyed on the absolute path. None outside of it so every other check sees the file system as it is
+_statCache = None
+
+@contextlib.contextmanager
+def _cachedStats():
+    """A context in which _stat looks every path up only once. Paths shared by many experiments (output directories, repeated source files) are then only looked up once per batch. The cache is dropped when the outermost context ends"""
+    global _statCache
+
+    if _statCache is not None:
+        yield
+        return
+
+    _statCache = {}
+    try:
+        yield
+    finally:
+        _statCache = None
+
+def _stat(path: str) -> os.stat_result:
+    """os.stat which is cached inside of _cachedStats. Only successful lookups are cached so a missing path is looked up again"""
+    if _statCache is None:
+        return os.stat(path)
+
+    path = os.path.abspath(path)
+    result = _statCache.get(path)
+    if result is None:
+        result = _statCache[path] = os.stat(path)
+    return result
+
+def _exists(path: pathlib.Path) -> bool:
+    """Checks if the path exists using the cached stat"""
+    try:
+        _stat(str(path))
+    except OSError:
+        return False
+    return True
+
+def _isDir(path: pathlib.Path) -> bool:
+    """Checks if the path is a directory using the cached stat"""
+    return _exists(path) and stat.S_ISDIR(_stat(str(path)).st_mode)
+
+def _isFile(path: pathlib.Path) -> bool:
+    """Checks if the path is a regular file using the cached stat"""
+    return _exists(path) and stat.S_ISREG(_stat(str(path)).st_mode)
+
+#The figure reused by every save. It is never shown so pyplot does not need to manage it
+_saveFigure = None
+
+def _saveAxes() -> 'mplAx.Axes':
+    """Returns the cleared axes of the figure used for saving. Reusing a single figure saves building a new figure and axes for every file saved"""
+    global _saveFigure
+
+    if _saveFigure is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        #Drawn straight onto an Agg canvas whatever the pyplot backend is. The interactive backends are never involved in saving
+        _saveFigure = Figure()
+        FigureCanvasAgg(_saveFigure)
+        _saveFigure.add_subplot(111)
+
+    ax = _saveFigure.axes[0]
+    ax.clear()
+    return ax
+
+def _styleContext(style_sheet: List[str]):
+    """Returns a context manager which applies a list of available style sheets using the cached rcParams rather than resolving the sheets again"""
+    return mpl.rc_context(_resolvedStyle(tuple(style_sheet)))
+
+def _configContext(config: 'plotConf'):
+    """Returns the style context of a plot configurator, or a context which does nothing if there is no configurator or it has no style sheet"""
+    if config is None or config.style_sheet is None:
+        return contextlib.nullcontext()
+    return _styleContext(config.style_sheet)
+
+def _buildExps(argList: list, maxWorkers: int = None) -> list:
+    """Builds one SpectExp per tuple of constructor arguments on a thread pool, keeping the order of argList. Reading is mostly file access and pandas parsing, both of which release the GIL"""
+    with _cachedStats():
+        if len(argList) < 2:
+            return [SpectExp(*args) for args in argList]
+
+        with ThreadPoolExecutor(max_workers = maxWorkers) as executor:
+            return list(executor.map(lambda args: SpectExp(*args), argList))
 
 class plotConf:
     """
@@ -40,22 +282,12 @@ class plotConf:
     post_ops(active_ax: matplotlib.axes.Axes): None
         This function applies postplot operations to some set of axes in order to set the display ranges correctly
     """
-    __plotConf_namespace = dict()
+    __slots__ = ("__title", "__axis_titles", "__axis_ranges", "__style_sheet", "__color_cycle", "__has_xlim", "__has_ylim")
 
     #Constructors
-    @dispatch(namespace = __plotConf_namespace)
-    def __init__(self):
-        """The Default constructor for the plotConf class"""
-        self.__title = None
-        self.__axis_titles = [None, None]
-        self.__axis_ranges = [[None, None], [None, None]]
-        self.__style_sheet = None
-        self.__color_cycle = None
-
-    @dispatch(str, list, list, list, Cycler, namespace = __plotConf_namespace)
-    def __init__(self, title: str, axis_titles: List[str], axis_ranges: List[List[float]], style_sheet: str = None, color_cycle: Cycler = None):
+    def __init__(self, title: str = None, axis_titles: List[str] = None, axis_ranges: List[List[float]] = None, style_sheet: List[str] = None, color_cycle: Cycler = None):
         """
-        This is the main constructor of the plotConf. It builds this class given a small description of what the plot should look like
+        This is the main constructor of the plotConf. It builds this class given a small description of what the plot should look like. If no title is given then the default (empty) configuration is built and no other arguments may be given
 
         Parameters
         ----------
@@ -68,18 +300,33 @@ class plotConf:
         axis_ranges: List[List[float, float]]
             A list of float pairs which describe the limits on the axis. A pair of Nones does not constrain that axis. In xyz order
 
-        style_sheet: str
-            The matplotlib style sheet which should be applied to the graph. Useful for changing basic things about the plot like axis colors and such
+        style_sheet: List[str]
+            The matplotlib style sheets which should be applied to the graph. Useful for changing basic things about the plot like axis colors and such
 
         color_cycle: Cycler
             The cycler for the plot. This sets how the graph "chooses" the properties of undefined data. It's a bit complicated but very powerful see here: https://matplotlib.org/3.3.3/tutorials/intermediate/color_cycle.html
         """
-        self.__init__()
-        self.title = title
-        self.axis_titles = axis_titles
-        self.axis_ranges = axis_ranges
-        self.style_sheet = style_sheet
-        self.color_cycle = color_cycle
+        self.__title = None
+        self.__axis_titles = [None, None]
+        self.__axis_ranges = [(None, None), (None, None)]
+        self.__style_sheet = None
+        self.__color_cycle = None
+        self.__has_xlim = False
+        self.__has_ylim = False
+
+        if title is None:
+            #The empty configuration takes no settings. They would otherwise be dropped without a word
+            if any(arg is not None for arg in (axis_titles, axis_ranges, style_sheet, color_cycle)):
+                raise TypeError("A plot configurator without a title takes no other settings")
+            return
+
+        self.setTitle(title)
+        if axis_titles is not None:
+            self.setAxisTitles(axis_titles)
+        if axis_ranges is not None:
+            self.setAxisRanges(axis_ranges)
+        self.setStyleSheet(style_sheet)
+        self.setColorCycle(color_cycle)
 
     #Dealing with the Title attribute
     @property
@@ -108,11 +355,10 @@ class plotConf:
         new_title: str
             The new title for the plot configuration
         """
-        if (isinstance(new_title, str) | (new_title is None)):
+        if (isinstance(new_title, str) or new_title is None):
             self.__title = new_title
         else:
             raise TypeError("The new title needs to be a string or None.\nGot: {}".format(type(new_title)))
-        return None
     
     #Dealing with the Axis Titles
     @property
@@ -141,23 +387,23 @@ class plotConf:
         new_titles: list(str) | maximum length: 2
             The titles for the configured plot as a list of strings
         """
-        if (not (isinstance(new_titles, list) | isinstance(new_titles, tuple))):
+        if (not isinstance(new_titles, (list, tuple))):
             raise TypeError("The input axis titles need to be in either a list or tuple")
 
         if (len(new_titles) > 2):
             raise ValueError("The input axis titles can only be at most length 2")
 
-        for index in range(len(new_titles)):
-            if (not isinstance(new_titles[index], str)):
-                raise ValueError("All of the input axis titles need to be strings. Got: {} at {}".format(type(new_titles[index]), index))
-            self.__axis_titles[index] = new_titles[index]
-        return None
+        index = _firstFailing(new_titles, lambda title: isinstance(title, str))
+        if (index is not None):
+            raise ValueError("All of the input axis titles need to be strings. Got: {} at {}".format(type(new_titles[index]), index))
+
+        self.__axis_titles[:len(new_titles)] = new_titles
 
     #Dealing with the axis ranges
     @property
     def axis_ranges(self):
-        """Returns the axis ranges of the plot"""
-        return self.__axis_ranges
+        """Returns the axis ranges of the plot as a tuple of pairs. Use setAxisRanges to change them"""
+        return tuple(self.__axis_ranges)
 
     @axis_ranges.setter
     def axis_ranges(self, new_ranges: List[List[float]]):
@@ -181,23 +427,28 @@ class plotConf:
             The new ranges for the configured plot as a list of pair of floats
         """
         #Error checks
-        if (not (isinstance(new_ranges, list) | isinstance(new_ranges, tuple))):
+        if (not isinstance(new_ranges, (list, tuple))):
             raise TypeError("The input axis ranges need to be in either a list or tuple")
         if (len(new_ranges) > 2):
             raise ValueError("The input axis titles can only be at most length 2")
 
         for index in range(len(new_ranges)):
             if (len(new_ranges[index]) != 2):
-                raise ValueError("The new axis ranges need to be in pairs. Index {} was not a pair".format(len(new_ranges)))
+                raise ValueError("The new axis ranges need to be in pairs. Index {} was not a pair".format(index))
 
-            if (not (isinstance(new_ranges[index][0], float), isinstance(new_ranges[index][0], int))):
-                raise ValueError("The first value in pair at index {} was not a float or integer".format(index))
+            if (not (new_ranges[index][0] is None or isinstance(new_ranges[index][0], (float, int)))):
+                raise ValueError("The first value in pair at index {} was not a float, integer or None".format(index))
 
-            if (not (isinstance(new_ranges[index][1], float), isinstance(new_ranges[index][1], int))):
-                raise ValueError("The second value in pair at index {} was not a float or integer".format(index))
+            if (not (new_ranges[index][1] is None or isinstance(new_ranges[index][1], (float, int)))):
+                raise ValueError("The second value in pair at index {} was not a float, integer or None".format(index))
 
-            self.__axis_ranges[index] = new_ranges[index]
-        return None
+            #Copied into a tuple so that changing the caller's pair later can not get around the checks or the limit flags below
+            self.__axis_ranges[index] = tuple(new_ranges[index])
+
+        #Worked out once here so postOps does not have to recheck the pairs on every plot
+        axis_ranges = self.__axis_ranges
+        self.__has_xlim = axis_ranges[0][0] is not None and axis_ranges[0][1] is not None
+        self.__has_ylim = axis_ranges[1][0] is not None and axis_ranges[1][1] is not None
 
     #Dealing with the stylesheet
     @property
@@ -236,15 +487,14 @@ class plotConf:
             self.__style_sheet = None
             return None
 
-        available_list = plt.style.available
+        assert isinstance(style_list, (list, tuple)), TypeError("The style list needs to be a tuple or list. Got {}".format(type(style_list)))
 
-        assert (isinstance(style_list, list) | isinstance(style_list, tuple)), TypeError("The style list needs to be a tuple or list. Got {}".format(type(style_list)))
+        available_styles = _availableStyles()
 
-        for index in range(len(style_list)):
-            assert (style_list[index] in available_list), ValueError("All possible styles need to be available. Index {} was not available. Got {}".format(index, style_list[index]))
+        index = _firstFailing(style_list, lambda style: style in available_styles)
+        assert (index is None), ValueError("All possible styles need to be available. Index {} was not available. Got {}".format(index, style_list[index]))
         
         self.__style_sheet = style_list
-        return None
 
     #Dealing with the color_tool
     @property
@@ -276,7 +526,7 @@ class plotConf:
             A cycler from the cycler library which sets the sequence in which colors and other options are selected. Needs to have at least "colors" set
         """
         #Error checking
-        if (not (isinstance(new_cycle, Cycler) | (new_cycle is None))):
+        if (not (new_cycle is None or isinstance(new_cycle, Cycler))):
             raise TypeError("The new cycle needs to be of class cycler. Got {}".format(type(new_cycle)))
 
         if (new_cycle is None):
@@ -287,10 +537,9 @@ class plotConf:
         assert("color" in new_cycle.keys), ValueError("The new cycle needs to have the color value set")
 
         self.__color_cycle = new_cycle
-        return None
 
     #Plot based operations
-    def preOps(self, active_ax: mplAx.Axes):
+    def preOps(self, active_ax: 'mplAx.Axes'):
         """
         The preplot operations which are done to some matplot figure in order to present it correctly
 
@@ -300,21 +549,21 @@ class plotConf:
         active_ax: matplotlib.axes.Axes
             The figure which the configurator is supposed to change and operate on
         """
-        if (self.color_cycle is not None):
-            active_ax.set_prop_cycle(self.color_cycle)
+        axis_titles = self.__axis_titles
 
-        if (self.title is not None):
-            active_ax.set_title(self.title)
+        if (self.__color_cycle is not None):
+            active_ax.set_prop_cycle(self.__color_cycle)
 
-        if (self.axis_titles[0] is not None):
-            active_ax.set_xlabel(self.axis_titles[0])
+        if (self.__title is not None):
+            active_ax.set_title(self.__title)
 
-        if (self.axis_titles[1] is not None):
-            active_ax.set_ylabel(self.axis_titles[1])
+        if (axis_titles[0] is not None):
+            active_ax.set_xlabel(axis_titles[0])
 
-        return None
+        if (axis_titles[1] is not None):
+            active_ax.set_ylabel(axis_titles[1])
 
-    def postOps(self, active_ax: mplAx.Axes):
+    def postOps(self, active_ax: 'mplAx.Axes'):
         """
         The postplot operations which are done to some matplot figure in order to present it correctly
 
@@ -324,29 +573,25 @@ class plotConf:
         active_ax :matplotlib axes
             The figure which the configurator is supposed to change and operate on
         """
-        
-        if (self.axis_ranges[0][0] is not None and self.axis_ranges[0][1] is not None):
-            active_ax.set_xlim(self.axis_ranges[0])
+        if (self.__has_xlim):
+            active_ax.set_xlim(self.__axis_ranges[0])
 
-        if (self.axis_ranges[1][0] is not None and self.axis_ranges[1][1] is not None):
-            active_ax.set_ylim(self.axis_ranges[1])
-
-        return None
+        if (self.__has_ylim):
+            active_ax.set_ylim(self.__axis_ranges[1])
 
     #<---------------------Operations--------------------->
     def __str__(self):
         """Prints the information for the plot configurator"""
         main_str = "Plot configurator settings\n"
 
-        main_str += "Title: {}\n".format(self.title)
+        main_str += "Title: {}\n".format(self.__title)
 
-        main_str += "X-axis Title: {}, Y-axis Title: {}\n".format(self.axis_titles[0], self.axis_titles[1])
+        main_str += "X-axis Title: {}, Y-axis Title: {}\n".format(*self.__axis_titles)
 
-        main_str += "Axis ranges: {}\n".format(self.axis_ranges)
+        main_str += "Axis ranges: {}\n".format(self.__axis_ranges)
 
-        if self.style_sheet is not None:
-            main_str += "[" + ("{}, " * (len(self.style_sheet) - 1)) + "{}]"
-            main_str.format(*self.style_sheet)
+        if self.__style_sheet is not None:
+            main_str += "[{}]".format(", ".join(self.__style_sheet))
 
         return main_str
 
@@ -355,29 +600,28 @@ class plotConf:
         Evaluates the equality of the plot configurator to another plot configurator
         """
         if not isinstance(value, plotConf):
-            return NotImplemented("plotConfs can only be equated to other plotConfs")
+            return NotImplemented
         
-        truth_value = True
+        if self is value:
+            return True
 
-        #Stylesheets
-        if (len(self.style_sheet) == len(value.style_sheet)):
-            for index in range(len(self.style_sheet)):
-                truth_value = truth_value and (self.style_sheet[index] == value.style_sheet[index])
-        else:
+        #Title
+        if (self.__title != value.__title):
             return False
 
-        #Axis ranges
-        for index in range(len(self.axis_ranges)):
-            truth_value = truth_value and (self.axis_ranges[index][0] == value.axis_ranges[index][0]) and (self.axis_ranges[index][1] == value.axis_ranges[index][1])
-
         #Axis Titles
-        for index in range(len(self.axis_titles)):
-            truth_value = truth_value and (self.axis_titles[index] == value.axis_titles[index])
+        if (tuple(self.__axis_titles) != tuple(value.__axis_titles)):
+            return False
 
-        #Title
-        truth_value = truth_value and (self.title == value.title)
+        #Axis ranges
+        self_ranges, value_ranges = self.__axis_ranges, value.__axis_ranges
+        if ((self_ranges[0][0], self_ranges[0][1], self_ranges[1][0], self_ranges[1][1]) != (value_ranges[0][0], value_ranges[0][1], value_ranges[1][0], value_ranges[1][1])):
+            return False
 
-        return truth_value
+        #Stylesheets (either can be unset)
+        self_styles = None if self.__style_sheet is None else tuple(self.__style_sheet)
+        value_styles = None if value.__style_sheet is None else tuple(value.__style_sheet)
+        return self_styles == value_styles
 
 class SpectExp:
     """
@@ -405,6 +649,9 @@ class SpectExp:
 
     Methods
     -------
+    batchLoad(sourceFiles: list(str), config: plotConf, outputPath: str, readDict: dict = None, maxWorkers: int = None) -> list(SpectExp)
+        Builds an experiment for each of the source files, reading them in parallel
+
     readFile(delim: str = ",", begin_line: str = None, convert_dict: dict = None, col_names: list(str) = None) -> Bool
         Attempts to read in the file for the experiment.
 
@@ -427,35 +674,20 @@ class SpectExp:
         Plots the data and then saves that information to the output path according to the name generators / set name
     """
 
-    __SpectExp_namespace = dict()
+    __slots__ = ("__plotConf", "__data", "__metaInfo", "__sourceFile", "__outputPath", "__name", "__saveFormat", "__parseIndex", "__sourceStem", "__wavelengths", "__measures")
 
     default_read_dict = {
             "delim": "\t", 
             "begin_line": ">>>>>Begin Spectral Data<<<<<\n", 
-            "convert_dict": {"A": "float64", "B": "float64"}, 
+            "convert_dict": {"Wavelength": "float64", "Measure": "float32"}, 
             "col_names": ["Wavelength", "Measure"]
         }
 
     #<---------------------Constructors--------------------->
 
-    @dispatch(namespace = __SpectExp_namespace)
-    def __init__(self):
-        """
-        The default constructor for the SpectExp class. Sets just about everything to None
-        """
-        self.__plotConf = plotConf()
-        self.__data = None
-        self.__metaInfo = None
-        self.__sourceFile = None
-        self.__outputPath = None
-        self.__name = None
-        self.__saveFormat = "png"
-        
-    @dispatch(plotConf, (pathlib.Path, str), (pathlib.Path, str), str, namespace = __SpectExp_namespace)
-    def __init__(self, config: plotConf, sourceFile: [pathlib.Path, str], outputPath: [pathlib.Path, str], name: str = None):
+    def __init__(self, config: plotConf = None, sourceFile: [pathlib.Path, str] = None, outputPath: [pathlib.Path, str] = None, name: str = None, readDict: dict = None):
         """
-
-        Constructs a given Spectral Experiment object using a "default read method". In other words using the most likely saved method for when the experiment was saved
+        Constructs a given Spectral Experiment object. If no plot configurator is given then just about everything is set to None and no other arguments may be given. If no read dictionary is given then the "default read method" is used. In other words using the most likely saved method for when the experiment was saved
 
         Parameters
         ----------
@@ -469,42 +701,63 @@ class SpectExp:
             The output path for the experiment
 
         name: str
-            The name of the experiment
+            The name of the experiment. If None the name is generated from the source file
 
-        """
-        self.__init__(config, sourceFile, outputPath, name, SpectExp.default_read_dict)
+        readDict: dict
+            A dictionary which describes the input into the "readFile" function. Thereby allowing the user to describe how they want their info file to be processed when reading it into the Spectral Experiment class. The keys are the readFile arguments: "delim", "begin_line", "convert_dict" and "col_names"
 
-    @dispatch(plotConf, (pathlib.Path, str), (pathlib.Path, str), str, dict, namespace = __SpectExp_namespace)
-    def __init__(self, config: plotConf, sourceFile: [pathlib.Path, str], outputPath: [pathlib.Path, str], name: str = None, readDict: dict = None):
         """
+        self.__plotConf = plotConf()
+        self.__data = None
+        self.__wavelengths = None
+        self.__measures = None
+        self.__metaInfo = None
+        self.__sourceFile = None
+        self.__outputPath = None
+        self.__name = None
+        self.__saveFormat = "png"
+        self.__parseIndex = None
+        self.__sourceStem = None
 
-        Constructs a given Spectral Experiment object using a "default read method". In other words using the most likely saved method for when the experiment was saved
+        if config is None:
+            if any(arg is not None for arg in (sourceFile, outputPath, name, readDict)):
+                raise TypeError("A spectral experiment without a plot configurator takes no other settings")
+            return
+
+        if readDict is None:
+            readDict = SpectExp.default_read_dict
+
+        self.setPlotConf(config)
+        self.setSource(sourceFile)
+        self.setOutPath(outputPath)
+        if name is not None:
+            self.setName(name)
+        #The read dictionary keys are the readFile arguments so they are passed straight through. Missing keys fall back to the readFile defaults
+        self.readFile(**readDict)
+
+    @classmethod
+    def batchLoad(cls, sourceFiles: List[str], config: plotConf, outputPath: [pathlib.Path, str], readDict: dict = None, maxWorkers: int = None) -> List['SpectExp']:
+        """
+        Builds one experiment per source file, reading the files on a thread pool
 
         Parameters
         ----------
-        config: plotConf
-            The plot configurator used for this experiment
+        sourceFiles: list([pathlib.Path, str])
+            The source data files. One experiment is built per file and named from the file name
 
-        sourceFile: [pathlib.Path, str]
-            The source data file for the experiment. Expects a txt or csv file
+        config: plotConf
+            The plot configurator used for all of the experiments
 
         outputPath: [pathlib.Path, str]
-            The output path for the experiment
-
-        name: str
-            The name of the experiment
+            The output path for all of the experiments
 
         readDict: dict
-            A dictionary which describes the input into the "readFile" function. Thereby allowing the user to describe how they want their info file to be processed when reading it into the Spectral Experiment class
+            The read dictionary used for all of the files. If None the default read dictionary is used
 
+        maxWorkers: int
+            The maximum number of threads to read with. If None the ThreadPoolExecutor default is used
         """
-        self.__init__()
-        self.setPlotConf(config)
-        self.setSource(sourceFile)
-        self.setOutPath(outputPath)
-        self.setName(name)
-        self.readFile(delim = readDict["delim"], begin_line = readDict["begin_line"], convert_dict = readDict["convert_dict"], col_names = readDict["col_names"])
-
+        return _buildExps([(config, sourceFile, outputPath, None, readDict) for sourceFile in sourceFiles], maxWorkers)
 
     #<---------------------Setters--------------------->
 
@@ -520,7 +773,6 @@ class SpectExp:
         assert isinstance(newConf, plotConf), "The new plot configurator needs to be a plot configurator. Got {}".format(type(newConf))
 
         self.__plotConf = newConf
-        return None
 
     def setData(self, newData: pd.DataFrame):
         """
@@ -537,7 +789,10 @@ class SpectExp:
 
         newData.columns = ["Wavelength", newData.columns[1]]
         self.__data = newData
-        return None
+
+        #Kept as arrays so plotting can hand them straight to matplotlib
+        self.__wavelengths = newData.iloc[:, 0].to_numpy()
+        self.__measures = newData.iloc[:, 1].to_numpy()
 
     def setSource(self, newSource: [pathlib.Path, str]):
         """
@@ -550,20 +805,20 @@ class SpectExp:
         """
         if (isinstance(newSource, pathlib.PurePath)):
             #If the user gave a path as input
-            if (not newSource.exists()):
+            if (not _exists(newSource)):
                 raise ValueError("The new source file does not exist")
-            if (newSource.is_file()):
+            if (_isFile(newSource)):
                 assert newSource.suffix in [".txt", ".csv"], "Source file needs to be either a txt file or a csv file. Got {}".format(newSource.suffix)
                 self.__sourceFile = newSource
+                self.__sourceStem = newSource.stem
+                self.__parseIndex = None
             else:
                 raise ValueError("The source path needs to lead to a file")
         elif (isinstance(newSource, str)):
             #If the user gave a string path
-            newSource = pathlib.Path(newSource)
-            self.setSource(newSource)
+            self.setSource(pathlib.Path(newSource))
         else:
             raise TypeError("Expected a string or path. Got {}".format(type(newSource)))
-        return None
 
     def setOutPath(self, newOutput: [pathlib.Path, str]):
         """
@@ -576,9 +831,9 @@ class SpectExp:
         """
         if (isinstance(newOutput, pathlib.PurePath)):
             #If the user gave a path as input
-            if (not newOutput.exists()):
+            if (not _exists(newOutput)):
                 raise ValueError("The new Output dir does not exist")
-            if (newOutput.is_dir()):
+            if (_isDir(newOutput)):
                 self.__outputPath = newOutput
             else:
                 raise ValueError("The source path needs to lead to a directory")
@@ -588,7 +843,6 @@ class SpectExp:
             self.setOutPath(newOutput)
         else:
             raise TypeError("Expected a string or path. Got {}".format(type(newOutput)))
-        return None
 
     def setName(self, newName: str):
         """
@@ -602,7 +856,6 @@ class SpectExp:
         assert isinstance(newName, str), "The new name needs to be a string. Got {}".format(type(newName))
 
         self.__name = newName
-        return None
 
     def setMetaInfo(self, newMeta: List[str]):
         """
@@ -613,13 +866,12 @@ class SpectExp:
         newMeta: list(str)
             A list of strings representing any metadata lifted from the sourcefile
         """
-        assert isinstance(newMeta, list) or isinstance(newMeta, tuple), "The new name needs to be a list of strings. Got {}".format(type(newMeta))
+        assert isinstance(newMeta, (list, tuple)), "The new name needs to be a list of strings. Got {}".format(type(newMeta))
 
-        for index in range(len(newMeta)):
-            assert isinstance(newMeta[index], str), "All entries into the meta list need to be strings. Index {} was not instead was {}".format(index, type(newMeta[index]))
+        index = _firstFailing(newMeta, lambda line: isinstance(line, str))
+        assert index is None, "All entries into the meta list need to be strings. Index {} was not instead was {}".format(index, type(newMeta[index]))
 
         self.__metaInfo = newMeta
-        return None
 
     #<---------------------Getters--------------------->
     
@@ -677,6 +929,10 @@ class SpectExp:
         """Returns the metadata of the experiment"""
         return self.__metaInfo
 
+    def getArrays(self):
+        """Returns the wavelength and measurement columns of the data as a pair of numpy arrays"""
+        return self.__wavelengths, self.__measures
+
     def getFormat(self):
         """Returns the save format for the experiment"""
         return self.__saveFormat
@@ -707,153 +963,135 @@ class SpectExp:
             The final line before the csv like data
 
         convert_dict: dict
-            What types the reader should convert the data to after reading it in (these are pandas types)
+            What types the reader should convert the data to after reading it in (these are pandas types). The keys need to match the entries of col_names otherwise they are ignored. A single type converts every column
 
         col_names: list(str)
             The names of the columns after the reader sets up after
+
+        Setting the SPECT_FAST_IO environment variable to 1, true, yes or on reads the data with the multithreaded pyarrow csv reader when pyarrow is installed
         """
         assert isinstance(begin_line, str) or begin_line is None, "The beginning line needs to be a string"
     
-        meta_list = []
+        #The cache key has to be hashable. A conversion dictionary is stored as its items while a single dtype for every column is kept as is
+        convert_key = tuple(convert_dict.items()) if isinstance(convert_dict, dict) else convert_dict
 
-        if begin_line is None:
-            pandas_read = pd.read_csv(self.getSource(), sep = delim, names = col_names, dtype = convert_dict)
-        else:
-            begin_line_met = False
-
-            with open(self.getSource(), "r") as active_file:
-                for line in active_file:
-                    if begin_line_met:
-                        pandas_read = pd.read_csv(active_file, sep = delim, names = col_names, dtype = convert_dict)
-                        break
-                    else:
-                        meta_list.append(line)
-
-                    if line == begin_line:
-                        begin_line_met = True
-        self.setMetaInfo(meta_list)
-        self.setData(pandas_read)
-        return None
+        #Unchanged files which were already read are not parsed again
+        meta_list, pandas_read = cachedRead(_readSpectFile, self.getSource(), delim, begin_line, convert_key,
+                                            None if col_names is None else tuple(col_names))
+
+        #The decoded header is a list of strings by construction so the per line checks of setMetaInfo are skipped
+        self.__metaInfo = list(meta_list)
+
+        #The cached frame is shared by every experiment reading this file so each gets its own copy
+        self.setData(pandas_read.copy())
 
     def nameParse(self) -> parse.Result:
         """
         Parses the name of the file into a series dictionary which is then used to construct the generated legend
         """
-        parse_strings = [
-            "{Type}_{Sample}_{Hour}-{Minute}-{Second}-{Msec}.{file_type}",
-            "{Type}_{Sample}_{Background}_{Hour}-{Minute}-{Second}-{Msec}.{file_type}",
-            "{Type}_{Sample}_{Background}_{Type2}_{Number}.{file_type}",
-            "{Type}_{Sample}_{Type2}_{Number}.{file_type}"
-        ]
-
         fileName = self.getSource().name
 
-        for standard in parse_strings:
-            result = parse.parse(standard, fileName)
+        #The pattern which matched last time is the most likely to match again
+        if self.__parseIndex is not None:
+            result = _NAME_PARSERS[self.__parseIndex].parse(fileName)
 
             if result is not None:
                 return result
 
+        for index, parser in enumerate(_NAME_PARSERS):
+            result = parser.parse(fileName)
+
+            if result is not None:
+                self.__parseIndex = index
+                return result
+
         raise ValueError("The Input file name {} did not parse right".format(fileName))
-        return None
 
     def outputNameGen(self) -> str:
         """
         Automatically generates the output name of the experiment using the source file and defined name
         """
-        if self.getName() is None:
-            return str.split(self.getSource().name, ".")[0] + self.getFormat()
+        if self.__name is None:
+            return "{}.{}".format(self.__sourceStem, self.__saveFormat)
         else:
-            return self.getName() + "." + self.getFormat()
+            return "{}.{}".format(self.__name, self.__saveFormat)
 
     def legendNameGen(self) -> str:
         """
         Automatically generates the legend name of the experiment using the source file and defined name
         """
-        if self.getName() is None:
+        name = self.__name
+
+        if name is None:
             parsedNames = self.nameParse()
-            keys = parsedNames.named.keys()
 
             legendName = "" + parsedNames["Sample"]
 
-            if "Background" in keys:
+            if "Background" in parsedNames.named:
                 legendName += " | BK: " + parsedNames["Background"]
             
             return legendName
         else:
-            return self.getName()
+            return name
 
     #<---------------------Plot Ops--------------------->
 
-    @dispatch(namespace = __SpectExp_namespace)
-    def plot(self) -> mplAx.Axes:
-        """
-        Plots the experiment by creating a new figure. Returns the axes which the data is plotted on. Automattically clears the current figure
-        """
-        plt.clf()
-        fig, ax = plt.subplot(1)
-        return self.plot(ax)
-
-    @dispatch(mplAx.Axes, namespace = __SpectExp_namespace)
-    def plot(self, ax: mplAx.Axes) -> mplAx.Axes:
-        """
-        Plots the experiment given a specific matplotlib axes. Will change the style though
-        """
-        return self.plot(ax, self.getPlotConf())
-
-    @dispatch(mplAx.Axes, (plotConf, type(None)), namespace = __SpectExp_namespace)
-    def plot(self, ax: mplAx.Axes, config: plotConf) -> mplAx.Axes:
+    def plot(self, ax: 'mplAx.Axes' = None, config: plotConf = _MISSING) -> 'mplAx.Axes':
         """
-        Plots the experiment given a temporary plot configurator
+        Plots the experiment on the given axes. Returns the axes which the data is plotted on
 
         Parameters
         ----------
         ax: matplotlib.axes.Axes
-            The axes you want to plot on
+            The axes you want to plot on. If not given then the current figure is cleared and a new set of axes is made
 
         config: plotConf
-            The temporary plot configurator. Can be none in which case the plot configurator will plot without stylization
+            A temporary plot configurator. If not given then the experiment's plot configurator is used. Can be None in which case the experiment will plot without stylization
         """
+        if ax is None:
+            plt = _pyplot()
+            plt.clf()
+            ax = plt.subplot(111)
+
+        if config is _MISSING:
+            config = self.getPlotConf()
+
         if isinstance(config, plotConf):
-            if config.style_sheet is not None:
-                with plt.style.context(config.style_sheet):
-                    self.__basePlot(ax, config)
-            else:
+            with _configContext(config):
                 self.__basePlot(ax, config)
         elif config is None:
-            ax.plot(self.getData()[self.getData().columns[0]], self.getData()[self.getData().columns[1]], label = self.legendNameGen())
+            self.__drawLine(ax)
         else:
             raise TypeError("The plot config was not None or of type plotConf")
         return ax
 
-    @dispatch(mplAx.Axes, namespace = __SpectExp_namespace)
-    def __basePlot(self, ax: mplAx.Axes) -> mplAx.Axes:
+    def __basePlot(self, ax: 'mplAx.Axes', config: plotConf = None) -> 'mplAx.Axes':
         """
         An internal plotting function which keeps all of the code organized and in one place
         """
-        return self.__basePlot(ax, self.getPlotConf())
+        if config is None:
+            config = self.getPlotConf()
 
-    @dispatch(mplAx.Axes, plotConf, namespace = __SpectExp_namespace)
-    def __basePlot(self, ax: mplAx.Axes, config: plotConf) -> mplAx.Axes:
-        """
-        An internal plotting function which keeps things cleaner
-        """
         config.preOps(ax)
-        ax.plot(self.getData()[self.getData().columns[0]], self.getData()[self.getData().columns[1]], label = self.legendNameGen())
+        self.__drawLine(ax)
         ax.legend()
         config.postOps(ax)
         return ax
 
+    def __drawLine(self, ax: 'mplAx.Axes'):
+        """
+        Draws the experiment's line on the axes without any stylization. Shared by the styled and unstyled plots
+        """
+        label = self.legendNameGen()
+        return ax.plot(self.__wavelengths, self.__measures, label = label)
+
     def save(self):
         """
         Saves the experiment to the output directory with the given saved format. Super useful to get an idea of what is going on
         """
-        fig = plt.gcf()
-        fig.clf()
-        ax = plt.subplot(111)
+        ax = _saveAxes()
         self.plot(ax)
-        fig.savefig(self.getOutPath() / self.outputNameGen())
-        return None
+        ax.figure.savefig(self.getOutPath() / self.outputNameGen())
 
     #<---------------------Operations--------------------->
 
@@ -862,24 +1100,24 @@ class SpectExp:
         main_str = ""
 
         #Name
-        if self.getName() is not None:
-            main_str += "Name: {}\n".format(self.getName())
+        if self.__name is not None:
+            main_str += "Name: {}\n".format(self.__name)
 
         #Source file
-        if self.getSource() is not None:
-            main_str += "Sourcefile: {}\n".format(self.getSource().resolve())
+        if self.__sourceFile is not None:
+            main_str += "Sourcefile: {}\n".format(self.__sourceFile.resolve())
         else:
             main_str += "Sourcefile: None\n"
 
         #Data
-        if self.getData() is not None:
-            main_str += "Data Shape: ({}, {})\n".format(*self.getData().shape)
+        if self.__data is not None:
+            main_str += "Data Shape: ({}, {})\n".format(*self.__data.shape)
         else:
             main_str += "Data Shape: Data not loaded\n"
 
         #Outpath
-        if self.getOutPath() is not None:
-            main_str += "Output Path: {}\n".format(self.getOutPath())
+        if self.__outputPath is not None:
+            main_str += "Output Path: {}\n".format(self.__outputPath)
         else:
             main_str += "Output Path: None\n"
 
@@ -919,16 +1157,18 @@ class SpectGroup:
 
     Compose()
 
+    invalidate()
+
     save(mode: str)
     """
 
-    __SpectGroup_namespace = dict()
-
     #<---------------------Constructors--------------------->
-    @dispatch(namespace = __SpectGroup_namespace)
-    def __init__(self):
+    def __init__(self, *args):
         """
-        Default constructor for the Spectral Group
+        Constructs a Spectral Group. With no arguments an empty group is made. Otherwise the arguments pick one of the following constructors
+            (expList, config, outputPath, name): Builds the group out of a list of spectral experiments
+            (fileList, readDict, nameList, config, outputPath, name): Builds the group by reading a list of files
+            (jsonFile, config, outputPath, name): Builds the group from a previously defined JSON file
         """
         self.__expList = []
         self.__plotConf = plotConf()
@@ -936,9 +1176,24 @@ class SpectGroup:
         self.__stats = None
         self.__outPath = None
         self.__name = None
+        self.__streaming = False
+        self.__labels = {}
+        self.__alignCache = None
+        self.__composed = None
+
+        if len(args) == 0:
+            return
+
+        if len(args) == 6:
+            self.__fromFiles(*args)
+        elif len(args) == 4 and isinstance(args[0], list):
+            self.__fromExps(*args)
+        elif len(args) == 4 and isinstance(args[0], (pathlib.Path, str)):
+            self.__fromJSON(*args)
+        else:
+            raise TypeError("No SpectGroup constructor takes the arguments {}".format(tuple(type(arg).__name__ for arg in args)))
 
-    @dispatch(list, plotConf, (pathlib.Path, str), str, namespace = __SpectGroup_namespace)
-    def __init__(self, expList: List[SpectExp], config: plotConf, outputPath: pathlib.Path, name: str):
+    def __fromExps(self, expList: List[SpectExp], config: plotConf, outputPath: pathlib.Path, name: str):
         """
         Builds the experiment group out of a list of spectral experiments. This is the root constructor
 
@@ -956,14 +1211,12 @@ class SpectGroup:
         name: str
             The name of the experiment
         """
-        self.__init__()
         self.setExpList(expList)
         self.setPlotConf(config)
         self.setOutPath(outputPath)
         self.setName(name)
 
-    @dispatch(list, dict, list, plotConf, (pathlib.Path, str), str, namespace = __SpectGroup_namespace)
-    def __init__(self, fileList: List[str], readDict: dict, nameList: List[str], config: plotConf, outputPath: pathlib.Path, name: str):
+    def __fromFiles(self, fileList: List[str], readDict: dict, nameList: List[str], config: plotConf, outputPath: pathlib.Path, name: str):
         """
         Builds the experiment from a file list, read dictionary, and name list. Useful for building the experiment group when the experiments aren't previously designed
 
@@ -991,18 +1244,14 @@ class SpectGroup:
         name: str
             The name of the experiment group
         """
-        self.__init__()
         assert len(fileList) == len(nameList), "The number of names must be equal to the number of experiments"
 
-        tmp_exp = []
-
-        for index in range(len(fileList)):
-            tmp_exp.append(SpectExp(config, fileList[index], outputPath, nameList[index], readDict))
+        #The files are independent so they are read in parallel
+        tmp_exp = _buildExps([(config, fileList[index], outputPath, nameList[index], readDict) for index in range(len(fileList))])
 
-        self.__init__(tmp_exp, config, outputPath, name)
+        self.__fromExps(tmp_exp, config, outputPath, name)
 
-    @dispatch((pathlib.Path, str), plotConf, (pathlib.Path, str), str, namespace = __SpectGroup_namespace)
-    def __init__(self, jsonFileList: pathlib.Path, config: plotConf, outputPath: pathlib.Path, name: str):
+    def __fromJSON(self, jsonFileList: pathlib.Path, config: plotConf, outputPath: pathlib.Path, name: str):
         """
         Builds the experimental group from a previously defined JSON file. Useful for quickly building previously used experiments and using things in a terminal
 
@@ -1023,15 +1272,15 @@ class SpectGroup:
         #Input Checks
         if (isinstance(jsonFileList, str)):
             jsonFileList = pathlib.Path(jsonFileList)
-        assert jsonFileList.exists(), ValueError("The JSON file did not exist")
-        assert jsonFileList.is_file(), ValueError("The JSON file was not a file")
+        assert _exists(jsonFileList), ValueError("The JSON file did not exist")
+        assert _isFile(jsonFileList), ValueError("The JSON file was not a file")
 
         assert isinstance(config, plotConf), TypeError("The configurator was not of type plotConf")
 
         if (isinstance(outputPath, str)):
             outputPath = pathlib.Path(outputPath)
-        assert outputPath.exists(), ValueError("The output path did not exist")
-        assert outputPath.is_dir(), ValueError("The output path was not a directory")
+        assert _exists(outputPath), ValueError("The output path did not exist")
+        assert _isDir(outputPath), ValueError("The output path was not a directory")
 
         assert isinstance(name, str), TypeError("The group name needs to be a string")
 
@@ -1042,45 +1291,35 @@ class SpectGroup:
         assert isinstance(jsonDict, dict), TypeError("After reading the JSON object was not an object. Instead got {}. Make sure it's between curly braces".format(type(jsonDict)))
         #assert ("readDict" in jsonDict.keys()), ValueError("The JSON file did not define a read dictionary for the experiments")
 
-        #Building all of the experiments
-        expList = []
-
-        if ("readDict" in jsonDict.keys()):
-            for key in [x for x in jsonDict.keys() if x != "readDict"]:
-                assert ("sourceFile" in jsonDict[key].keys()), KeyError("The sourceFile key was not defined in the {} experiment".format(key))
-                assert ("outputPath" in jsonDict[key].keys()), KeyError("The outputPath key was not defined in the {} experiment".format(key))
-                assert ("name" in jsonDict[key].keys()), KeyError("The name key was not defined in the {} experiment".format(key))
-
-                if ("range" in jsonDict[key].keys()):
-                    if len(jsonDict[key]["range"]) == 3:
-                        for num in range(jsonDict[key]["range"][0], jsonDict[key]["range"][1] + 1, jsonDict[key]["range"][2]):
-                            expList.append(SpectExp(config, jsonDict[key]["sourceFile"].format(num), jsonDict[key]["outputPath"].format(num), jsonDict[key]["name"].format(num), jsonDict["readDict"]))
-                    elif len(jsonDict[key]["range"]) == 2:
-                        for num in range(jsonDict[key]["range"][0], jsonDict[key]["range"][1] + 1):
-                            expList.append(SpectExp(config, jsonDict[key]["sourceFile"].format(num), jsonDict[key]["outputPath"].format(num), jsonDict[key]["name"].format(num), jsonDict["readDict"]))
-                    else:
-                        raise ValueError("The range was not defined correctly")
-                else:
-                    expList.append(SpectExp(config, jsonDict[key]["sourceFile"], jsonDict[key]["outputPath"], jsonDict[key]["name"], jsonDict["readDict"]))
-        else:
-            for key in [x for x in jsonDict.keys() if x != "readDict"]:
-                assert ("sourceFile" in jsonDict[key].keys()), KeyError("The sourceFile key was not defined in the {} experiment".format(key))
-                assert ("outputPath" in jsonDict[key].keys()), KeyError("The outputPath key was not defined in the {} experiment".format(key))
-                assert ("name" in jsonDict[key].keys()), KeyError("The name key was not defined in the {} experiment".format(key))
-
-                if ("range" in jsonDict[key].keys()):
-                    if len(jsonDict[key]["range"]) == 3:
-                        for num in range(jsonDict[key]["range"][0], jsonDict[key]["range"][1] + 1, jsonDict[key]["range"][2]):
-                            expList.append(SpectExp(config, jsonDict[key]["sourceFile"].format(num), jsonDict[key]["outputPath"].format(num), jsonDict[key]["name"].format(num)))
-                    elif len(jsonDict[key]["range"]) == 2:
-                        for num in range(jsonDict[key]["range"][0], jsonDict[key]["range"][1] + 1):
-                            expList.append(SpectExp(config, jsonDict[key]["sourceFile"].format(num), jsonDict[key]["outputPath"].format(num), jsonDict[key]["name"].format(num)))
-                    else:
-                        raise ValueError("The range was not defined correctly")
-                else:
-                    expList.append(SpectExp(config, jsonDict[key]["sourceFile"], jsonDict[key]["outputPath"], jsonDict[key]["name"]))
-
-        self.__init__(expList, config, outputPath, name)
+        #Collecting the constructor arguments of all of the experiments so they can be read in parallel
+        read_dict_arg = (jsonDict["readDict"],) if "readDict" in jsonDict else ()
+        argList = list(chain.from_iterable(self.__entryArgs(key, entry, config, read_dict_arg) for key, entry in jsonDict.items() if key != "readDict"))
+
+        expList = _buildExps(argList)
+
+        self.__fromExps(expList, config, outputPath, name)
+
+    @staticmethod
+    def __entryArgs(key: str, entry: dict, config: plotConf, read_dict_arg: tuple):
+        """
+        Yields the SpectExp constructor arguments of one experiment entry of a group JSON file. An entry with a range yields one set of arguments per number in the range
+        """
+        assert ("sourceFile" in entry), KeyError("The sourceFile key was not defined in the {} experiment".format(key))
+        assert ("outputPath" in entry), KeyError("The outputPath key was not defined in the {} experiment".format(key))
+        assert ("name" in entry), KeyError("The name key was not defined in the {} experiment".format(key))
+
+        sourceFile, expOutput, expName = entry["sourceFile"], entry["outputPath"], entry["name"]
+        rng = entry.get("range")
+
+        if rng is None:
+            yield (config, sourceFile, expOutput, expName) + read_dict_arg
+            return
+
+        #The range is [start, stop] or [start, stop, step] with an inclusive stop
+        if len(rng) not in (2, 3):
+            raise ValueError("The range was not defined correctly")
+
+        yield from ((config, sourceFile.format(num), expOutput.format(num), expName.format(num)) + read_dict_arg for num in range(rng[0], rng[1] + 1, *rng[2:]))
 
     #<-----------------------Setters------------------------>
     def setExpList(self, expList: List[SpectExp]):
@@ -1090,13 +1329,11 @@ class SpectGroup:
         expList: list(SpectExp)
             A list of experiments used by the group
         """
-        for index in range(len(expList)):
-            if (not isinstance(expList[index], SpectExp)):
-                raise TypeError("Each experiment in the new spectral experiments needs to be of type SpectExp. Got {} at index{}".format(type(expList[index]), index))
+        index = _firstFailing(expList, lambda exp: isinstance(exp, SpectExp))
+        if index is not None:
+            raise TypeError("Each experiment in the new spectral experiments needs to be of type SpectExp. Got {} at index{}".format(type(expList[index]), index))
         self.__expList = expList
-        self.__data = None
-        self.__stats = None
-        return None
+        self.__dropDerived()
 
     def addExp(self, exp: SpectExp):
         """
@@ -1108,9 +1345,25 @@ class SpectGroup:
         assert isinstance(exp, SpectExp), "Expected a spectral experiment but got {}".format(type(exp))
 
         self.__expList.append(exp)
+        self.__dropDerived()
+
+    def invalidate(self):
+        """
+        Drops the composed data, the statistics and the wavelength alignment of the group so that they are rebuilt the next time they are needed. Has to be called if the data of an experiment in the group is changed after it was added, either through setData or in its dataframe
+        """
+        #The group reads the arrays of the experiments, which only setData refreshes from the dataframe
+        for exp in self.__expList:
+            if exp.isLoaded():
+                exp.setData(exp.getData())
+
+        self.__alignCache = None
+        self.__dropDerived()
+
+    def __dropDerived(self):
+        """An internal function which drops the composed data and the statistics built from the experiments"""
         self.__data = None
+        self.__composed = None
         self.__stats = None
-        return None
 
     def setPlotConf(self, config: plotConf):
         """
@@ -1124,7 +1377,6 @@ class SpectGroup:
         assert isinstance(config, plotConf), "The new plot configurator needs to be a plot configurator. Got {}".format(type(config))
 
         self.__plotConf = config
-        return None
 
     def setData(self, newData: pd.DataFrame):
         """
@@ -1136,7 +1388,27 @@ class SpectGroup:
         assert isinstance(newData, pd.DataFrame), "The new data needs to be a pandas dataframe"
         assert "Wavelength" in newData.columns, "The new data needs to have a wavelength column"
         self.__data = newData
-        return None
+        self.__composed = None
+
+        #The statistics were built from the old data
+        self.__stats = None
+
+    def __setComposed(self, wavelengths: np.ndarray, measures: np.ndarray, columns: List[str]):
+        """
+        An internal setter for the composed data which keeps it as arrays. The dataframe is only built when getData is called and then replaces the arrays
+
+        wavelengths: numpy.ndarray
+            The wavelength grid of the composed data
+
+        measures: numpy.ndarray
+            The measurements with one row per wavelength and one column per experiment
+
+        columns: list(str)
+            The column names of the measurements
+        """
+        self.__composed = (wavelengths, measures, columns)
+        self.__data = None
+        self.__stats = None
 
     def setStats(self, newStats: pd.DataFrame):
         """
@@ -1147,7 +1419,6 @@ class SpectGroup:
         """
         assert isinstance(newStats, pd.DataFrame), "The new data needs to be a pandas dataframe"
         self.__stats = newStats
-        return None
 
     def setOutPath(self, newOutput: pathlib.Path):
         """
@@ -1160,9 +1431,9 @@ class SpectGroup:
         """
         if (isinstance(newOutput, pathlib.PurePath)):
             #If the user gave a path as input
-            if (not newOutput.exists()):
+            if (not _exists(newOutput)):
                 raise ValueError("The new Output dir does not exist")
-            if (newOutput.is_dir()):
+            if (_isDir(newOutput)):
                 self.__outPath = newOutput
             else:
                 raise ValueError("The source path needs to lead to a directory")
@@ -1172,7 +1443,6 @@ class SpectGroup:
             self.setOutPath(newOutput)
         else:
             raise TypeError("Expected a string or path. Got {}".format(type(newOutput)))
-        return None
 
     def setName(self, newName: str):
         """
@@ -1186,23 +1456,41 @@ class SpectGroup:
         assert isinstance(newName, str), "The new name needs to be a string. Got {}".format(type(newName))
 
         self.__name = newName
-        return None
+        self.__labels = {}
+
+    def setStreaming(self, streaming: bool):
+        """
+        Sets whether the statistics are generated by streaming through the experiments rather than from the composed data. Streaming never builds the composed data, which saves memory for large groups, but needs every experiment to share one wavelength grid. Otherwise the composed data is used anyways
+
+        Parameters
+        ----------
+        streaming: bool
+            True to stream the statistics
+        """
+        assert isinstance(streaming, bool), "The streaming flag needs to be a bool. Got {}".format(type(streaming))
+
+        self.__streaming = streaming
 
     #<-----------------------Getters------------------------>
-    @dispatch(namespace = __SpectGroup_namespace)
-    def getExpList(self) -> List[SpectExp]:
-        """Returns the experiment list"""
-        return self.__expList
+    def getExpList(self, colNums: List[int] = None) -> List[SpectExp]:
+        """Returns the experiment list. If a list of indexes is given only those experiments are returned in that order"""
+        if colNums is None:
+            return self.__expList
+
+        if len(colNums) == 0:
+            return []
 
-    @dispatch(list, namespace = __SpectGroup_namespace)
-    def getExpList(self, colNums: List[int]):
-        return_list = []
-        for index in range(len(colNums)):
-            assert isinstance(colNums[index], int), "All indexes must be integers. Got {} at index {}".format(type(colNums[index]), index)
-            assert colNums[index] < len(self.__expList), "All indexes must be within range. Index {} was out of range".format(index)
-            return_list.append(self.__expList[colNums[index]])
+        #The indexes are checked all at once as an array rather than one by one
+        indexes = np.asarray(colNums)
+        if indexes.dtype.kind not in "iu":
+            raise TypeError("All indexes must be integers. Got {}".format(indexes.dtype))
 
-        return return_list
+        #Negative indexes count from the end like list indexing
+        count = len(self.__expList)
+        if indexes.min() < -count or indexes.max() >= count:
+            raise IndexError("All indexes must be within range. Got indexes from {} to {} for {} experiments".format(indexes.min(), indexes.max(), count))
+
+        return [self.__expList[index] for index in indexes.tolist()]
 
     def getExp(self, index: int) -> SpectExp:
         """Returns a specific experiment of the experiment list"""
@@ -1214,6 +1502,13 @@ class SpectGroup:
 
     def getData(self) -> pd.DataFrame:
         """Returns the data for the experiment group"""
+        if self.__data is None and self.__composed is not None:
+            wavelengths, measures, columns = self.__composed
+
+            #Built once when it is first asked for. From then on the frame is the only copy of the data so that changes made to it are seen by genStats
+            self.__data = pd.DataFrame(measures, columns = columns, copy = False)
+            self.__data.insert(0, "Wavelength", wavelengths)
+            self.__composed = None
         return self.__data
 
     def getStats(self) -> pd.DataFrame:
@@ -1231,11 +1526,15 @@ class SpectGroup:
     #<----------------------Conditions---------------------->
     def isComposed(self) -> bool:
         """A conditional formula to check if the data has all of the experiments loaded in properly"""
-        if self.getData() is None:
+        if self.__data is None and self.__composed is None:
             return False
         else:
             return True
 
+    def isStreaming(self) -> bool:
+        """A conditional formula to check if the statistics are streamed through the experiments"""
+        return self.__streaming
+
     def isStats(self) -> bool:
         """A conditional formula to check if the statistics have been calculated yet"""
         if self.getStats() is None:
@@ -1253,35 +1552,96 @@ class SpectGroup:
         groupDef: list(list(int))
             This is a list of a list of integers where the integers represent indicies in the experiment list
         """
-        Subgroup = []
-
-        for main_index in range(len(groupDef)):
-            for second_index in range(len(groupDef[main_index])):
-                assert isinstance(groupDef[main_index][second_index], int), "The subgroup definition can only have integer indecies"
-            Subgroup.append(SpectGroup(self.__expList[groupDef[main_index]], self.getPlotConf(), self.getOutPath(), "Subgroup #{} of {}".format(main_index + 1, self.getName())))
-        return Subgroup
+        #getExpList checks that every subgroup definition only has integer indexes in range
+        return [SpectGroup(self.getExpList(subDef), self.getPlotConf(), self.getOutPath(), "Subgroup #{} of {}".format(main_index + 1, self.getName())) for main_index, subDef in enumerate(groupDef)]
 
     def genStats(self):
         """Generates the statistics dataframe from the data of the experimental group. Currently calculates the min, max, mean, and std of each row"""
+        if self.isStreaming() and not self.isComposed() and self.__streamStats():
+            return
+
         if not self.isComposed():
             self.Compose()
-        
-        tmp_stats = self.getData()[["Wavelength"]].copy()
-        tmp_stats["min"] = self.getData().drop("Wavelength", axis = 1).min(axis = 1)
-        tmp_stats["max"] = self.getData().drop("Wavelength", axis = 1).max(axis = 1)
-        tmp_stats["mean"] = self.getData().drop("Wavelength", axis = 1).mean(axis = 1)
-        tmp_stats["std"] = self.getData().drop("Wavelength", axis = 1).std(axis = 1)
+
+        #Composed data nobody has asked for yet is reduced straight from its arrays. Otherwise the dataframe holds the data
+        if self.__composed is not None:
+            wavelengths, measures, _ = self.__composed
+            index = None
+        else:
+            data = self.getData()
+            wavelengths = data["Wavelength"].to_numpy()
+            measures = data.drop(columns = "Wavelength").to_numpy()
+            index = data.index
+
+        #The nan reductions skip missing values like the pandas ones. Rows with too few values give nan without warning, also like pandas
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            tmp_stats = pd.DataFrame({
+                "Wavelength": wavelengths,
+                "min": np.nanmin(measures, axis = 1),
+                "max": np.nanmax(measures, axis = 1),
+                "mean": np.nanmean(measures, axis = 1),
+                "std": np.nanstd(measures, axis = 1, ddof = 1)
+            }, index = index)
         self.setStats(tmp_stats)
-        return None
+
+    def __streamStats(self) -> bool:
+        """
+        Generates the statistics one experiment at a time with Welford's running mean and variance so that the composed data is never built. Returns False without setting anything if the experiments do not share one wavelength grid
+        """
+        self.__checkLoaded(range(len(self.getExpList())), self.getExpList())
+
+        arrays = (exp.getArrays() for exp in self.getExpList())
+        wavelengths, first = next(arrays)
+
+        #Like the composed statistics missing values are skipped, so every row keeps its own count of the values it has seen
+        low = first.copy()
+        high = first.copy()
+        mean = np.zeros(first.shape, dtype = np.float64)
+        m2 = np.zeros_like(mean)
+        count = np.zeros(first.shape, dtype = np.int64)
+
+        for exp_wavelengths, measures in chain([(wavelengths, first)], arrays):
+            if not np.array_equal(exp_wavelengths, wavelengths):
+                return False
+
+            valid = ~np.isnan(measures)
+            count += valid
+            delta = np.where(valid, measures - mean, 0.0)
+            mean += np.divide(delta, count, out = np.zeros_like(delta), where = valid)
+            m2 += np.where(valid, delta * (measures - mean), 0.0)
+            np.fmin(low, measures, out = low)
+            np.fmax(high, measures, out = high)
+
+        #Rows without values have no mean and rows with a single value have no spread. Like pandas both are nan
+        mean[count == 0] = np.nan
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+
+        #The sums are kept in double precision but the results take the precision of the measurements like the composed statistics do
+        result_type = np.result_type(first.dtype, np.float32)
+        mean = mean.astype(result_type, copy = False)
+        std = std.astype(result_type, copy = False)
+
+        self.setStats(pd.DataFrame({
+            "Wavelength": wavelengths,
+            "min": low,
+            "max": high,
+            "mean": mean,
+            "std": std
+        }))
+        return True
 
     #<-----------------------Plot Ops----------------------->
-    @dispatch(str, mplAx.Axes, (plotConf, type(None)), namespace = __SpectGroup_namespace)
-    def plot(self, mode: str, ax: mplAx.Axes, config: plotConf) -> mplAx.Axes:
+    def plot(self, modeOrList: [str, list], *rest) -> 'mplAx.Axes':
         """
-        Plots the experimental group data in a specific way on the given axes
+        Plots the experimental group data in a specific way on the given axes. Called either as plot(mode, ax, config) or as plot(gList, mode, ax, config) to also plot a list of other spectral groups on the same axes with the same mode. The first argument, modeOrList, is the mode or the group list depending on the call
 
         Parameters
         ----------
+        gList: List(SpectGroup)
+            Optional. The spectral group list which tells which groups to plot on the same plot
+
         mode: str
             A string representing the plotting mode of the experimental group. The valid options are the following
                 stack: Plots all of the experimental group onto the same set of axes
@@ -1292,119 +1652,50 @@ class SpectGroup:
             The axes onto which the plot will be made
 
         config: plotConf
-            The configurator used to style the plot. Can be None to have no stylization on the plot
-        """
-        if isinstance(config, plotConf):
-            if config.style_sheet is not None:
-                with plt.style.context(config.style_sheet):
-                    config.preOps(ax)
-                    self.__plotSwitch(mode, ax)
-                    config.postOps(ax)
-            else:
-                config.preOps(ax)
-                self.__plotSwitch(mode, ax)
-                config.postOps(ax)
-        elif config is None:
-            self.__plotSwitch(mode, ax)
-        else:
-            raise TypeError("The plot config was not None or of type plotConf")
-        ax.legend()
-        return ax
-
-    @dispatch(str, mplAx.Axes, namespace = __SpectGroup_namespace)
-    def plot(self, mode: str, ax: mplAx.Axes) -> mplAx.Axes:
+            Optional. The configurator used to style the plot. Can be None to have no stylization on the plot. If not given the group's configurator is used
         """
-        Plots all of the experimental groups data on the given axes using the experimental groups default configurator
-
-        Parameters
-        ----------
-        mode: str
-            A string representing the plotting mode of the experimental group. The valid options are the following
-                stack: Plots all of the experimental group onto the same set of axes
-                range: Plots the minimum and maximum of the data ranges. Gives a good idea of the possible values
-                1std: Plots the average and the first standard deviation from the average. Gives an idea of the error
+        args = (modeOrList,) + rest if isinstance(modeOrList, list) else ([], modeOrList) + rest
+        if not 3 <= len(args) <= 4:
+            raise TypeError("SpectGroup.plot takes (mode, ax, config) or (gList, mode, ax, config) where config is optional. Got {} arguments".format(len(rest) + 1))
+        return self.__plotGroups(*args)
 
-        ax: matplotlib.axes.Axes
-            The axes onto which the plot will be made
+    def __plotGroups(self, gList: list, mode: str, ax: 'mplAx.Axes', config: plotConf = _MISSING) -> 'mplAx.Axes':
         """
-        return self.plot(mode, ax, self.getPlotConf())
-
-    @dispatch(list, str, mplAx.Axes, (plotConf, type(None)))
-    def plot(self, gList: list, mode: str, ax: mplAx.Axes, config: plotConf) -> mplAx.Axes:
+        An internal function which plots this group followed by the groups of gList. See plot for the parameters
         """
-        Plots the Spectral group given a list of other spectral groups. Plots using the same plotConf and mode
+        if config is _MISSING:
+            config = self.getPlotConf()
 
-        Parameters
-        ----------
-        gList: List(SpectGroup)
-            The spectral group list which tells which groups to plot on the same plot
+        for index in range(len(gList)):
+            assert isinstance(gList[index], SpectGroup), "Index {} of the spectral group list was not a spectral group".format(index)
 
-        mode: str
-            A string representing the plotting mode of the experimental group. The valid options are the following
-                stack: Plots all of the experimental group onto the same set of axes
-                range: Plots the minimum and maximum of the data ranges. Gives a good idea of the possible values
-                1std: Plots the average and the first standard deviation from the average. Gives an idea of the error
-
-        ax: matplotlib.axes.Axes
-            The axes to plot all of the groups onto
+        if config is not None and not isinstance(config, plotConf):
+            raise TypeError("The plot config was not None or of type plotConf")
 
-        config: plotConf
-            The configurator to use when plotting
-        """
-        if isinstance(config, plotConf):
-            if config.style_sheet is not None:
-                with plt.style.context(config.style_sheet):
-                    config.preOps(ax)
-                    self.__plotSwitch(mode, ax)
-
-                    #Iterate over list
-                    for index in range(len(gList)):
-                        assert isinstance(gList[index], SpectGroup), "Index {} of the spectral group list was not a spectral group".format(index)
-                        gList[index].plot(mode, ax, None)
-                    config.postOps(ax)
-            else:
+        with _configContext(config):
+            if config is not None:
                 config.preOps(ax)
-                self.__plotSwitch(mode, ax)
-
-                #Iterate over list
-                for index in range(len(gList)):
-                    assert isinstance(gList[index], SpectGroup), "Index {} of the spectral group list was not a spectral group".format(index)
-                    gList[index].plot(mode, ax, None)
-                config.postOps(ax)
-        elif config is None:
             self.__plotSwitch(mode, ax)
 
-            #Iterate over list
-            for index in range(len(gList)):
-                assert isinstance(gList[index], SpectGroup), "Index {} of the spectral group list was not a spectral group".format(index)
-                gList[index].plot(mode, ax, None)
-        else:
-            raise TypeError("The plot config was not None or of type plotConf")
+            #The other groups draw without stylization. The legend is only built once at the end
+            for group in gList:
+                group.__plotSwitch(mode, ax)
+
+            if config is not None:
+                config.postOps(ax)
         ax.legend()
         return ax
 
-    @dispatch(list, str, mplAx.Axes)
-    def plot(self, gList: list, mode: str, ax: mplAx.Axes) -> mplAx.Axes:
+    def __modeLabel(self, suffix: str) -> str:
         """
-        Plots the Spectral group given a list of other spectral groups. Plots using the SpectGroup's default plot configurator
-
-        Parameters
-        ----------
-        gList: List(SpectGroup)
-            The spectral group list which tells which groups to plot on the same plot
-
-        mode: str
-            A string representing the plotting mode of the experimental group. The valid options are the following
-                stack: Plots all of the experimental group onto the same set of axes
-                range: Plots the minimum and maximum of the data ranges. Gives a good idea of the possible values
-                1std: Plots the average and the first standard deviation from the average. Gives an idea of the error
-
-        ax: matplotlib.axes.Axes
-            The axes to plot all of the groups onto
+        Returns the legend label made from the group name and the given suffix. The labels are kept until the name of the group changes
         """
-        return self.plot(gList, mode, ax, self.getPlotConf())
+        label = self.__labels.get(suffix)
+        if label is None:
+            label = self.__labels[suffix] = self.getName() + suffix
+        return label
 
-    def __plotSwitch(self, mode: str, ax: mplAx.Axes) -> mplAx.Axes:
+    def __plotSwitch(self, mode: str, ax: 'mplAx.Axes') -> 'mplAx.Axes':
         """
         An internal function which determines the different possible plotting modes for the experimental group
 
@@ -1416,79 +1707,47 @@ class SpectGroup:
         ax: matplotlib.axes.Axes
             The axes onto which the data will be plotted
         """
-        if mode.lower() == "stack":
-            for exp in self.getExpList():
-                exp.plot(ax, None)
-        elif mode.lower() == "range":
+        switch = mode.lower()
+
+        if switch == "stack":
+            expList = self.getExpList()
+
+            #A single plot call for all of the experiments. The lines still take their colors from the property cycle in order
+            lines = ax.plot(*chain.from_iterable(exp.getArrays() for exp in expList))
+            for line, exp in zip(lines, expList):
+                line.set_label(exp.legendNameGen())
+        elif switch == "range":
             if not self.isStats():
                 self.genStats()
-            ax.fill_between(self.getStats()["Wavelength"], self.getStats()["min"], self.getStats()["max"], label = self.getName() + " RANGE")
-        elif mode.lower() == "1std":
+            stats = self.getStats()
+
+            #The bands are rasterized so vector outputs do not have to stroke a polygon with a vertex per wavelength
+            ax.fill_between(stats["Wavelength"].to_numpy(), stats["min"].to_numpy(), stats["max"].to_numpy(), label = self.__modeLabel(" RANGE"), rasterized = True)
+        elif switch == "1std":
             if not self.isStats():
                 self.genStats()
+            stats = self.getStats()
+
+            #Each column is read once as an array and the band edges are computed without building pandas series
+            mean = stats["mean"].to_numpy()
+            std = stats["std"].to_numpy()
+            wavelengths = stats["Wavelength"].to_numpy()
 
-            ax.fill_between(self.getStats()["Wavelength"], self.getStats()["mean"] - self.getStats()["std"], self.getStats()["mean"] + self.getStats()["std"], alpha = 0.2)
-            ax.plot(self.getStats()["Wavelength"], self.getStats()["mean"], label = self.getName() + " AVG")
+            ax.fill_between(wavelengths, mean - std, mean + std, alpha = 0.2, rasterized = True)
+            ax.plot(wavelengths, mean, label = self.__modeLabel(" AVG"))
         else:
             raise ValueError("The input mode was incorrect. Got {}".format(mode))
         return ax
 
-    @dispatch(list, str, str)
-    def save(self, gList: list, mode: str, fileName: str):
+    def save(self, modeOrList: [str, list], *rest):
         """
-        Saves the experimental group into the output location using the given mode and file name
+        Saves the experimental group into the output location using the given mode. Called either as save(mode, fileName) or as save(gList, mode, fileName) to also plot a list of other spectral groups into the same file. The first argument, modeOrList, is the mode or the group list depending on the call
 
         Parameters
         ----------
-        mode: str
-            A string representing the plotting mode of the experimental group. The valid options are the following
-                stack: Plots all of the experimental group onto the same set of axes
-                range: Plots the minimum and maximum of the data ranges. Gives a good idea of the possible values
-                1std: Plots the average and the first standard deviation from the average. Gives an idea of the error
-
-        fileName: str
-            The name under which you want to save the file
-
         gList: List(SpectGroup)
-            The list of spectral groups you want to save on the same file given a mode
-        """
-        fig = plt.gcf()
-        fig.clf()
-        ax = plt.subplot()
-        self.plot(gList, mode, ax)
-        fig.savefig(self.getOutPath() / (fileName + ".png"))
-        return None
-
-    @dispatch(list, str)
-    def save(self, gList: list, mode: str):
-        """
-        Saves the experimental group into the output location using the given mode and file name
-
-        Parameters
-        ----------
-        mode: str
-            A string representing the plotting mode of the experimental group. The valid options are the following
-                stack: Plots all of the experimental group onto the same set of axes
-                range: Plots the minimum and maximum of the data ranges. Gives a good idea of the possible values
-                1std: Plots the average and the first standard deviation from the average. Gives an idea of the error
+            Optional. The list of spectral groups you want to save on the same file given a mode
 
-        gList: List(SpectGroup)
-            The list of spectral groups you want to save on the same file given a mode
-        """
-        fig = plt.gcf()
-        fig.clf()
-        ax = plt.subplot()
-        self.plot(gList, mode, ax)
-        fig.savefig(self.getOutPath() / (self.getName() + ".png"))
-        return None
-
-    @dispatch(str, str)
-    def save(self, mode: str, fileName: str):
-        """
-        Saves the experimental group into the output location using the given mode and file name
-
-        Parameters
-        ----------
         mode: str
             A string representing the plotting mode of the experimental group. The valid options are the following
                 stack: Plots all of the experimental group onto the same set of axes
@@ -1496,30 +1755,23 @@ class SpectGroup:
                 1std: Plots the average and the first standard deviation from the average. Gives an idea of the error
 
         fileName: str
-            The name under which you want to save the file
+            Optional. The name under which you want to save the file. If not given the name of the group is used
         """
-        fig = plt.gcf()
-        fig.clf()
-        ax = plt.subplot()
-        self.plot(mode, ax)
-        fig.savefig(self.getOutPath() / (fileName + ".png"))
-        return None
+        args = (modeOrList,) + rest if isinstance(modeOrList, list) else ([], modeOrList) + rest
+        if not 2 <= len(args) <= 3:
+            raise TypeError("SpectGroup.save takes (mode, fileName) or (gList, mode, fileName) where fileName is optional. Got {} arguments".format(len(rest) + 1))
+        self.__saveGroups(*args)
 
-    @dispatch(str)
-    def save(self, mode: str):
+    def __saveGroups(self, gList: list, mode: str, fileName: str = None):
         """
-        Saves the experimental group into the output location using the given mode
-
-        Parameters
-        ----------
-        mode: str
-            A string representing the plotting mode of the experimental group. The valid options are the following
-                stack: Plots all of the experimental group onto the same set of axes
-                range: Plots the minimum and maximum of the data ranges. Gives a good idea of the possible values
-                1std: Plots the average and the first standard deviation from the average. Gives an idea of the error
+        An internal function which saves this group and the groups of gList to one file. See save for the parameters
         """
-        self.save(mode, self.getName())
-        return None
+        if fileName is None:
+            fileName = self.getName()
+
+        ax = _saveAxes()
+        self.__plotGroups(gList, mode, ax)
+        ax.figure.savefig(self.getOutPath() / (fileName + ".png"))
 
     #<----------------------Operations---------------------->
     def __Compose(self, colIndexes: List[int]):
@@ -1531,17 +1783,83 @@ class SpectGroup:
         colIndexes: list(int)
             A list of integers telling the group which experiments to compile into the data dataframe
         """
-        for index in colIndexes:
-            if not self.getExp(index).isLoaded():
-                raise ValueError("Experiment at index {} was not loaded".format(index))
-        tmp_data = reduce(lambda x, y: pd.merge(x, y, on = ["Wavelength"], suffixes = ("_", "_")), [x.getData() for x in self.getExpList()]) #TODO: Implement getExpList properly
-        tmp_data.columns = ["Wavelength"] + ["Exp_{}".format(x) for x in colIndexes]
-        self.setData(tmp_data)
-        return None
+        #Only the requested experiments take part. Their arrays are read straight from the experiments without going through their dataframes
+        expList = self.getExpList(colIndexes)
+
+        self.__checkLoaded(colIndexes, expList)
+
+        wavelengths, alignment = self.__alignment(colIndexes, expList)
+
+        measureList = [exp.getArrays()[1] for exp in expList]
+
+        #Gaps are filled with nan so aligned measurements need a floating point type
+        dtype = np.result_type(*measureList)
+        if any(positions is not None for positions in alignment):
+            dtype = np.result_type(dtype, np.float32)
+
+        #One buffer holds all of the measurements. Column major so each experiment is written into contiguous memory, which is also the layout pandas keeps its blocks in
+        buffer = np.empty((len(wavelengths), len(measureList)), dtype = dtype, order = "F")
+
+        _fillComposed(buffer, measureList, alignment)
+
+        #The composed data is kept as arrays with its final column names. The dataframe is only built if it is asked for
+        self.__setComposed(wavelengths, buffer, ["Exp_{}".format(x) for x in colIndexes])
+
+    @staticmethod
+    def __checkLoaded(colIndexes: List[int], expList: List[SpectExp]):
+        """
+        An internal function which raises a ValueError listing every experiment in expList which was not loaded. colIndexes gives the group index of each experiment for the message
+        """
+        loaded = np.fromiter((exp.isLoaded() for exp in expList), dtype = bool, count = len(expList))
+
+        if not loaded.all():
+            missing = np.asarray(colIndexes)[~loaded]
+            if len(missing) == 1:
+                raise ValueError("Experiment at index {} was not loaded".format(missing[0]))
+            raise ValueError("Experiments at indexes {} were not loaded".format(", ".join(str(index) for index in missing)))
+
+    def __alignment(self, colIndexes: List[int], expList: List[SpectExp]) -> tuple:
+        """
+        An internal function which returns the wavelength grid of the composed data along with, for each experiment, the row of every grid wavelength in that experiment (-1 if it was not measured). The rows are None for experiments which are already on the grid. The result is kept until the wavelengths of an experiment change
+        """
+        keys = tuple(exp.getArrays()[0] for exp in expList)
+
+        #setData always makes new arrays and the cache keeps the old ones alive, so the same array objects mean the same wavelengths
+        if self.__alignCache is not None:
+            cached_keys, wavelengths, alignment = self.__alignCache
+            if len(cached_keys) == len(keys) and all(cached is key for cached, key in zip(cached_keys, keys)):
+                return wavelengths, alignment
+
+        wavelengths = keys[0]
+
+        if all(np.array_equal(key, wavelengths) for key in keys[1:]):
+            #Experiments from the same instrument share one wavelength grid so the measurements can just be stacked
+            alignment = [None] * len(keys)
+        else:
+            #Otherwise the grid is the sorted union of the wavelengths
+            wavelengths = np.unique(np.concatenate(keys))
+            alignment = []
+
+            for index, exp_wavelengths in zip(colIndexes, keys):
+                #Spectrometers write increasing wavelengths. Those are unique by construction and can be matched against the sorted grid with a binary search instead of hashing
+                if np.all(exp_wavelengths[1:] > exp_wavelengths[:-1]):
+                    alignment.append(_sortedPositions(exp_wavelengths, wavelengths))
+                    continue
+
+                exp_index = pd.Index(exp_wavelengths)
+
+                #Looking up the grid needs every wavelength to be a unique key in its experiment (a one to one join)
+                if not exp_index.is_unique:
+                    raise ValueError("Experiment at index {} has repeated wavelengths so it can not be aligned with the other experiments".format(index))
+
+                #One hash lookup of the whole grid gives the row of each grid wavelength in the experiment
+                alignment.append(exp_index.get_indexer(wavelengths))
+
+        self.__alignCache = (keys, wavelengths, alignment)
+        return wavelengths, alignment
 
     def Compose(self):
         """
         Takes all of the data from the experiment list and composes it into the data of the experiment group. This makes things easier to manage
         """
         self.__Compose([*range(0, len(self.getExpList()))])
-        return None
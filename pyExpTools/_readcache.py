@@ -0,0 +1,30 @@
+from functools import lru_cache
+import pathlib
+import os
+
+@lru_cache(maxsize = 256)
+def _cachedRead(readFunc, source: str, mtime_ns: int, args: tuple):
+    """The memoised call behind cachedRead. The modification time is only part of the key"""
+    return readFunc(pathlib.Path(source), *args)
+
+def cachedRead(readFunc, source: [pathlib.Path, str], *args):
+    """
+    Runs readFunc(source, *args) once per read function, resolved source path, modification time and arguments. Reading an unchanged file again returns the earlier result while an edited file gets a new modification time and is read again. The result is shared by every caller so it has to be copied before it is changed
+
+    Parameters
+    ----------
+    readFunc: callable(Path, *args)
+        The function which reads the file
+
+    source: [pathlib.Path, str]
+        The file to read
+
+    args:
+        Extra arguments passed on to readFunc. They have to be hashable
+    """
+    source = pathlib.Path(source).resolve()
+    return _cachedRead(readFunc, str(source), os.stat(source).st_mtime_ns, args)
+
+def clearReadCache():
+    """Empties the cache of cachedRead"""
+    _cachedRead.cache_clear()
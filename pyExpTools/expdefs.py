@@ -1,6 +1,10 @@
 import pandas as pd
+import numpy as np
+import pathlib
 
-class GenExp(Object):
+from ._readcache import cachedRead
+
+class GenExp:
     """
     A class which represents a general computational experiment
 
@@ -13,7 +17,87 @@ class GenExp(Object):
     data: pandas.Dataframe
 
     genFunc: callable(Path, **kargs) -> Path
+
+    wavelengths: numpy.ndarray
+        The first column of the data. Kept as an array so it can be used without going through the dataframe
+
+    values: numpy.ndarray
+        The second column of the data. Kept as an array so it can be used without going through the dataframe
     """
 
-    def __init__(self):
-        pass
\ No newline at end of file
+    __slots__ = ("__sourcefile", "__readFunc", "__data", "__genFunc", "__wavelengths", "__values")
+
+    def __init__(self, sourcefile: [pathlib.Path, str] = None, readFunc = None, genFunc = None):
+        """
+        Constructs a general experiment. Nothing is read until readData is called
+
+        Parameters
+        ----------
+        sourcefile: [pathlib.Path, str]
+            The file the experiment data is read from
+
+        readFunc: callable(Path) -> pandas.Dataframe
+            The function which reads the source file into a dataframe
+
+        genFunc: callable(Path, **kargs) -> Path
+            The function which generates the source file of the experiment
+        """
+        self.__sourcefile = None if sourcefile is None else pathlib.Path(sourcefile)
+        self.__readFunc = readFunc
+        self.__genFunc = genFunc
+        self.__data = None
+        self.__wavelengths = None
+        self.__values = None
+
+    def setData(self, newData: pd.DataFrame):
+        """
+        Sets the data of the experiment
+
+        Parameters
+        ----------
+        newData: pandas.DataFrame
+            The data of the experiment. The first column is taken as the wavelengths and the second as the values
+        """
+        assert isinstance(newData, pd.DataFrame), "The new data needs to be a pandas dataframe. Got {}".format(type(newData))
+        assert newData.shape[1] >= 2, "The new data needs at least two columns. Got {}".format(newData.shape[1])
+
+        self.__data = newData
+        self.__wavelengths = newData.iloc[:, 0].to_numpy()
+        self.__values = newData.iloc[:, 1].to_numpy()
+
+    def readData(self):
+        """Reads the source file into the data of the experiment using the read function. Unchanged files which were already read are not parsed again"""
+        assert self.__sourcefile is not None, "The experiment has no source file to read"
+        assert callable(self.__readFunc), "The experiment has no read function"
+
+        self.setData(cachedRead(self.__readFunc, self.__sourcefile).copy())
+
+    def getSource(self) -> pathlib.Path:
+        """Returns the source file of the experiment"""
+        return self.__sourcefile
+
+    def getReadFunc(self):
+        """Returns the read function of the experiment"""
+        return self.__readFunc
+
+    def getGenFunc(self):
+        """Returns the generating function of the experiment"""
+        return self.__genFunc
+
+    def getData(self) -> pd.DataFrame:
+        """Returns the data of the experiment"""
+        return self.__data
+
+    def isLoaded(self) -> bool:
+        """A conditional formula to check if the data has been read in"""
+        return self.__data is not None
+
+    @property
+    def wavelengths(self) -> np.ndarray:
+        """Returns the wavelengths of the experiment as an array"""
+        return self.__wavelengths
+
+    @property
+    def values(self) -> np.ndarray:
+        """Returns the values of the experiment as an array"""
+        return self.__values
@@ -7,8 +7,8 @@ setup(
     description="A library for setting up repeating computational experiments and plotting behavior",
     author="Joel Kelsey",
     license="MIT",
-    install_requires=["pandas", "matplotlib"],
+    install_requires=["pandas", "matplotlib", "numpy", "cycler", "parse"],
     setup_requires=["pytest-runner"],
-    tests_requires=["pytest==6.2.5"],
+    tests_require=["pytest==6.2.5"],
     test_suite="tests"
 )
\ No newline at end of file
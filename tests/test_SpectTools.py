@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+import os
+
+from pyExpTools.SpectTools import SpectExp, SpectGroup, plotConf
+
+_HEADER = ["Data from test.txt Node", "Integration Time (sec): 1.0E-1", ">>>>>Begin Spectral Data<<<<<"]
+
+def _writeSpect(path, rows, header = _HEADER):
+    """Writes an OceanView like spectral data file with the given header lines and (wavelength, measure) rows"""
+    path.write_text("\n".join(list(header) + ["{}\t{}".format(*row) for row in rows]) + "\n")
+    return path
+
+def _readExp(path):
+    """Reads a spectral data file with the default read dictionary"""
+    return SpectExp(plotConf("Test"), path, path.parent, path.stem)
+
+def _makeGroup(measureList, streaming):
+    """Builds a group of experiments which share one wavelength grid straight from their measurements"""
+    wavelengths = np.linspace(200.0, 800.0, len(measureList[0]))
+    expList = []
+    for index, measures in enumerate(measureList):
+        exp = SpectExp()
+        exp.setName("Exp_{}".format(index))
+        exp.setData(pd.DataFrame({"Wavelength": wavelengths, "Measure": np.asarray(measures, dtype = np.float32)}))
+        expList.append(exp)
+
+    group = SpectGroup()
+    group.setExpList(expList)
+    group.setStreaming(streaming)
+    return group
+
+def test_stream_stats_match_composed_stats_with_nans():
+    measureList = [
+        [1.0, np.nan, 3.0, np.nan, 5.0],
+        [2.0, np.nan, np.nan, 4.0, 1.0],
+        [4.0, np.nan, 6.0, np.nan, 2.0],
+    ]
+
+    streamed = _makeGroup(measureList, True)
+    streamed.genStats()
+    composed = _makeGroup(measureList, False)
+    composed.genStats()
+
+    #The streamed statistics never build the composed data
+    assert not streamed.isComposed()
+    assert composed.isComposed()
+
+    for column in ["Wavelength", "min", "max", "mean", "std"]:
+        np.testing.assert_allclose(streamed.getStats()[column].to_numpy(), composed.getStats()[column].to_numpy(), rtol = 1e-6, equal_nan = True)
+
+def test_read_missing_values_as_nan(tmp_path):
+    exp = _readExp(_writeSpect(tmp_path / "Abs_Missing_1.txt", [(200.0, 1.0), (210.0, "NaN"), (220.0, ""), (230.0, 4.0)]))
+
+    measures = exp.getData()["Measure"].to_numpy()
+    assert measures.dtype == np.float32
+    np.testing.assert_array_equal(np.isnan(measures), [False, True, True, False])
+
+def test_invalidate_picks_up_changed_experiment_data(tmp_path):
+    expList = [_readExp(_writeSpect(tmp_path / "Abs_Exp_{}.txt".format(index), [(200.0, index), (210.0, index + 1.0)])) for index in range(2)]
+    group = SpectGroup(expList, plotConf("Test"), tmp_path, "Group")
+    group.genStats()
+    assert group.getStats()["max"].max() == 2.0
+
+    expList[0].getData()["Measure"] = 100.0
+    group.invalidate()
+    group.genStats()
+    np.testing.assert_array_equal(group.getStats()["max"].to_numpy(), [100.0, 100.0])
+
+def _raisesValueError(func, *args):
+    """Checks that calling func with args raises a ValueError"""
+    try:
+        func(*args)
+    except ValueError:
+        return True
+    return False
+
+def test_output_path_checks_see_the_file_system_after_loading(tmp_path):
+    source = _writeSpect(tmp_path / "Abs_Exp_1.txt", [(200.0, 1.0)])
+    (tmp_path / "gone").mkdir()
+    (tmp_path / "elsewhere").mkdir()
+    (tmp_path / "out").mkdir()
+    exp = SpectExp.batchLoad([source, source], plotConf("Test"), tmp_path / "gone")[0]
+
+    os.rmdir(tmp_path / "gone")
+    assert _raisesValueError(exp.setOutPath, str(tmp_path / "gone"))
+
+    old_cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        exp.setOutPath("out")
+        os.chdir(tmp_path / "elsewhere")
+        assert _raisesValueError(exp.setOutPath, "out")
+    finally:
+        os.chdir(old_cwd)
+
+def test_begin_line_has_to_be_a_whole_line(tmp_path):
+    header = ["Data from test.txt Node", "Comment: data follows >>>>>Begin Spectral Data<<<<<", ">>>>>Begin Spectral Data<<<<<"]
+    exp = _readExp(_writeSpect(tmp_path / "Abs_Marker_1.txt", [(200.0, 1.0), (210.0, 2.0)], header))
+
+    np.testing.assert_array_equal(exp.getData()["Wavelength"].to_numpy(), [200.0, 210.0])
+    assert len(exp.getMeta()) == 3
+
+def test_compose_with_an_empty_experiment(tmp_path):
+    expList = [_readExp(_writeSpect(tmp_path / "Abs_Full_1.txt", [(200.0, 1.0), (210.0, 2.0)])),
+               _readExp(_writeSpect(tmp_path / "Abs_Empty_1.txt", []))]
+    group = SpectGroup(expList, plotConf("Test"), tmp_path, "Group")
+    group.Compose()
+
+    data = group.getData()
+    np.testing.assert_array_equal(data["Wavelength"].to_numpy(), [200.0, 210.0])
+    assert data.iloc[:, 2].isna().all()
+
+def test_first_data_row_is_read(tmp_path):
+    exp = _readExp(_writeSpect(tmp_path / "Abs_First_1.txt", [(200.0, 1.0), (210.0, 2.0), (220.0, 3.0)]))
+
+    np.testing.assert_array_equal(exp.getData()["Wavelength"].to_numpy(), [200.0, 210.0, 220.0])
+    np.testing.assert_array_equal(exp.getData()["Measure"].to_numpy(), [1.0, 2.0, 3.0])
+
+def test_plot_conf_equality_with_other_types():
+    assert plotConf("Test").__eq__("Test") is NotImplemented
+    assert plotConf("Test") != "Test"
+    assert plotConf("Test", ["x", "y"]) == plotConf("Test", ["x", "y"])
+
+def test_unnamed_output_name_has_extension(tmp_path):
+    exp = SpectExp(plotConf("Test"), _writeSpect(tmp_path / "Abs_Unnamed_1.txt", [(200.0, 1.0)]), tmp_path)
+
+    assert exp.outputNameGen() == "Abs_Unnamed_1.png"
+
+def test_gen_subgroup_takes_index_lists(tmp_path):
+    expList = [_readExp(_writeSpect(tmp_path / "Abs_Exp_{}.txt".format(index), [(200.0, index)])) for index in range(3)]
+    group = SpectGroup(expList, plotConf("Test"), tmp_path, "Group")
+
+    subgroups = group.genSubgroup([[0, 2], [1]])
+    assert [[exp.getName() for exp in subgroup.getExpList()] for subgroup in subgroups] == [["Abs_Exp_0", "Abs_Exp_2"], ["Abs_Exp_1"]]
+
+def test_compose_three_mismatched_grids(tmp_path):
+    gridList = [[200.0, 210.0], [210.0, 220.0], [200.0, 230.0]]
+    expList = [_readExp(_writeSpect(tmp_path / "Abs_Grid_{}.txt".format(index), [(wavelength, index + 1.0) for wavelength in grid])) for index, grid in enumerate(gridList)]
+    group = SpectGroup(expList, plotConf("Test"), tmp_path, "Group")
+    group.Compose()
+
+    data = group.getData()
+    np.testing.assert_array_equal(data["Wavelength"].to_numpy(), [200.0, 210.0, 220.0, 230.0])
+    np.testing.assert_array_equal(data.iloc[:, 1:].to_numpy(), [[1.0, np.nan, 3.0], [1.0, 2.0, np.nan], [np.nan, 2.0, np.nan], [np.nan, np.nan, 3.0]])
+
+def test_group_plot_and_save_with_and_without_group_lists(tmp_path):
+    from matplotlib.figure import Figure
+
+    expList = [_readExp(_writeSpect(tmp_path / "Abs_Exp_{}.txt".format(index), [(200.0, index), (210.0, index + 1.0)])) for index in range(2)]
+    group = SpectGroup(expList, plotConf("Test"), tmp_path, "Group")
+    other = SpectGroup(expList, plotConf("Test"), tmp_path, "Other")
+
+    ax = Figure().add_subplot(111)
+    assert group.plot("stack", ax) is ax
+    assert group.plot([other], "range", ax, None) is ax
+
+    group.save("1std")
+    group.save([other], "stack", "Both")
+    assert (tmp_path / "Group.png").is_file()
+    assert (tmp_path / "Both.png").is_file()
+
+    for args in [(), ("stack",), ([other], "stack")]:
+        try:
+            group.plot(*args)
+        except TypeError:
+            continue
+        raise AssertionError("plot{} did not raise a TypeError".format(args))
+
+def test_gen_exp_reads_its_source(tmp_path):
+    from pyExpTools.expdefs import GenExp
+
+    source = tmp_path / "gen.csv"
+    source.write_text("x,y\n1.0,2.0\n3.0,4.0\n")
+    exp = GenExp(source, pd.read_csv)
+    exp.readData()
+
+    assert exp.isLoaded()
+    np.testing.assert_array_equal(exp.wavelengths, [1.0, 3.0])
+    np.testing.assert_array_equal(exp.values, [2.0, 4.0])